@@ -0,0 +1,95 @@
+import heapq
+import json
+import sys
+from datetime import datetime
+
+def join_generations_to_composers(composers, generations):
+    """Asigna cada generación a los compositores cuya ventana la contiene.
+
+    Join por ordenación y mezcla: compositores ordenados por `createdAt`,
+    generaciones por `unixMs`, y un heap con los compositores abiertos
+    ordenado por `lastUpdatedAt`. Coste O((n + m) log n) más el tamaño del
+    resultado, en lugar de comparar cada generación con cada compositor.
+
+    Devuelve un diccionario {composerId: [(índice, generación), ...]} con las
+    generaciones en orden cronológico. Se usa el id porque los nombres se
+    repiten (y los compositores sin nombre no se distinguirían).
+    """
+    sessions = []
+    for composer in composers:
+        if not isinstance(composer, dict) or 'createdAt' not in composer or 'composerId' not in composer:
+            continue
+        start = composer['createdAt']
+        end = composer.get('lastUpdatedAt', start)
+        sessions.append((start, end, composer['composerId']))
+    sessions.sort(key=lambda s: s[0])
+
+    timed = sorted(
+        ((gen.get('unixMs', 0), i, gen) for i, gen in enumerate(generations)),
+        key=lambda g: (g[0], g[1])
+    )
+
+    by_id = {}
+    open_sessions = []  # heap de (lastUpdatedAt, orden, composerId)
+    next_session = 0
+    for timestamp, i, gen in timed:
+        # Abrir los compositores que ya habían empezado
+        while next_session < len(sessions) and sessions[next_session][0] <= timestamp:
+            start, end, composer_id = sessions[next_session]
+            heapq.heappush(open_sessions, (end, next_session, composer_id))
+            next_session += 1
+        # Cerrar los que terminaron antes de esta generación
+        while open_sessions and open_sessions[0][0] < timestamp:
+            heapq.heappop(open_sessions)
+        for _, _, composer_id in open_sessions:
+            by_id.setdefault(composer_id, []).append((i, gen))
+
+    return by_id
+
+def generations_for_session(sessions_index, composer_id):
+    """Todo el código producido en la sesión `composer_id` (lista vacía si no hay)"""
+    return sessions_index.get(composer_id, [])
+
+def load_sessions_index():
+    """Devuelve (compositores, índice por composerId)"""
+    with open('aiService_generations_recovery.json', 'r', encoding='utf-8') as f:
+        generations = json.load(f)
+    with open('composer_composerData_recovery.json', 'r', encoding='utf-8') as f:
+        composer_data = json.load(f)
+    composers = [c for c in composer_data.get('allComposers', []) if isinstance(c, dict)]
+    return composers, join_generations_to_composers(composers, generations)
+
+def show_session(name):
+    composers, sessions_index = load_sessions_index()
+    # Varios compositores pueden compartir nombre: se muestra cada uno por separado
+    matching = [c for c in composers if c.get('name', 'Sin nombre') == name]
+
+    print(f'🔍 GENERACIONES DE LA SESIÓN: {name}')
+    print('=' * 80)
+
+    if not matching:
+        print('❌ No hay ningún compositor con ese nombre')
+        return
+
+    for composer in matching:
+        composer_id = composer.get('composerId', 'unknown')
+        session_gens = generations_for_session(sessions_index, composer_id)
+        print(f'\n📝 Compositor {composer_id[:8]}...: {len(session_gens)} generaciones')
+
+        for i, gen in session_gens:
+            readable_time = datetime.fromtimestamp(gen.get('unixMs', 0) / 1000)
+            desc = gen.get('textDescription', '').strip()
+            if len(desc) > 200:
+                desc = desc[:200] + '...'
+            print(f'\n{i:3d} [{readable_time}]: {desc}')
+            print('-' * 80)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        show_session(' '.join(sys.argv[1:]))
+    else:
+        composers, sessions_index = load_sessions_index()
+        for composer in composers:
+            session_gens = generations_for_session(sessions_index, composer.get('composerId'))
+            if session_gens:
+                print(f'{composer.get("name", "Sin nombre")} ({composer["composerId"][:8]}): {len(session_gens)} generaciones')
@@ -0,0 +1,149 @@
+import hashlib
+import heapq
+import json
+import os
+import sqlite3
+import sys
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+PROMPTS_KEY = 'aiService.prompts'
+GENERATIONS_KEY = 'aiService.generations'
+
+def load_snapshot(path, key):
+    """Lee `key` de un snapshot: un state.vscdb o una carpeta con los *_recovery.json"""
+    if os.path.isdir(path):
+        filename = os.path.join(path, f'{key.replace(".", "_")}_recovery.json')
+        if not os.path.exists(filename):
+            return []
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'No existe el snapshot: {path}')
+
+    # Solo lectura: nunca crear ni modificar la base de datos del workspace
+    conn = sqlite3.connect(Path(path).resolve().as_uri() + '?mode=ro', uri=True)
+    try:
+        cursor = conn.cursor()
+        cursor.execute('SELECT value FROM ItemTable WHERE key = ?', (key,))
+        result = cursor.fetchone()
+    finally:
+        conn.close()
+    return json.loads(result[0]) if result else []
+
+def record_keys(kind, records, id_field=None):
+    """Clave de deduplicación de cada registro de un snapshot.
+
+    UUID si existe; si no, hash del contenido más el número de aparición de
+    ese contenido dentro del snapshot. Así un prompt repetido ("si",
+    "implementalo"...) sigue contando varias veces en su workspace, y solo
+    se descarta la misma aparición vista en otro snapshot.
+    """
+    occurrences = {}
+    for record in records:
+        if id_field and record.get(id_field):
+            yield kind, record[id_field]
+            continue
+        content = json.dumps(record, sort_keys=True, ensure_ascii=False)
+        digest = hashlib.sha1(content.encode('utf-8')).digest()
+        occurrence = occurrences.get(digest, 0)
+        occurrences[digest] = occurrence + 1
+        yield kind, digest, occurrence
+
+def generation_stream(path, generations):
+    """Generaciones de un snapshot, ya ordenadas por unixMs"""
+    for gen, key in zip(generations, record_keys('generation', generations, 'generationUUID')):
+        yield {
+            'kind': 'generation',
+            'unixMs': gen.get('unixMs', 0),
+            'workspace': path,
+            'key': key,
+            'text': gen.get('textDescription', ''),
+            'record': gen
+        }
+
+def prompt_stream(path, prompts, generations):
+    """Prompts de un snapshot en su orden, con una hora aproximada.
+
+    Los prompts no guardan timestamp: se toma el `unixMs` de la siguiente
+    generación cuya descripción coincide con el texto, y si no hay ninguna
+    se hereda el del prompt anterior (0 antes de la primera coincidencia).
+    Es una aproximación: en los datos de ejemplo solo 85 de 281 prompts
+    coinciden con alguna generación y el resto comparten unos pocos valores,
+    así que entre workspaces el orden de esos prompts no es cronológico real.
+    Dentro de un mismo workspace el orden original sí se conserva.
+    """
+    pending = {}
+    for gen in generations:
+        pending.setdefault(gen.get('textDescription'), deque()).append(gen.get('unixMs', 0))
+
+    last_timestamp = 0
+    for prompt, key in zip(prompts, record_keys('prompt', prompts)):
+        text = prompt.get('text', '')
+        candidates = pending.get(text)
+        while candidates and candidates[0] < last_timestamp:
+            candidates.popleft()
+        if candidates:
+            last_timestamp = candidates.popleft()
+        yield {
+            'kind': 'prompt',
+            'unixMs': last_timestamp,
+            'workspace': path,
+            'key': key,
+            'text': text,
+            'record': prompt
+        }
+
+def merged_history(snapshots, kinds=('prompt', 'generation')):
+    """Historial global ordenado de varios snapshots (k-way merge con heap).
+
+    Cada snapshot aporta flujos ordenados por tiempo; `heapq.merge` solo
+    mantiene en el heap la cabeza de cada flujo. Un registro ya visto en otro
+    snapshot (mismo UUID, o mismo contenido y número de aparición) se
+    descarta. Los duplicados comparten `unixMs`, así que basta con recordar
+    las claves del tramo actual de timestamps iguales: la memoria depende del
+    número de fuentes y del tramo más largo, no del total de registros.
+    En los prompts la hora es aproximada (ver prompt_stream): un prompt
+    repetido en dos snapshots solo se detecta si a ambos se les asigna la
+    misma hora, como pasa con snapshots del mismo workspace.
+
+    Los datos de cada snapshot se siguen leyendo enteros con json.load (la
+    librería estándar no tiene un parser JSON incremental).
+    """
+    streams = []
+    for path in snapshots:
+        generations = load_snapshot(path, GENERATIONS_KEY)
+        if 'prompt' in kinds:
+            streams.append(prompt_stream(path, load_snapshot(path, PROMPTS_KEY), generations))
+        if 'generation' in kinds:
+            streams.append(generation_stream(path, generations))
+
+    run_timestamp = None
+    run_keys = {}  # clave -> workspace que la aportó, solo del tramo actual
+    for entry in heapq.merge(*streams, key=lambda e: e['unixMs']):
+        if entry['unixMs'] != run_timestamp:
+            run_timestamp = entry['unixMs']
+            run_keys = {}
+        source = run_keys.setdefault(entry['key'], entry['workspace'])
+        if source != entry['workspace']:
+            continue
+        yield entry
+
+def show_consolidated_history(snapshots):
+    print(f'🔍 HISTORIAL CONSOLIDADO DE {len(snapshots)} WORKSPACES:')
+    print('=' * 80)
+
+    for i, entry in enumerate(merged_history(snapshots), 1):
+        readable_time = datetime.fromtimestamp(entry['unixMs'] / 1000) if entry['unixMs'] else 'Sin timestamp'
+        label = '💬 Prompt' if entry['kind'] == 'prompt' else '🤖 Generación'
+        text = entry['text'].strip()
+        if len(text) > 300:
+            text = text[:300] + '...'
+
+        print(f'\n{i:4d} [{readable_time}] {label} ({entry["workspace"]}): {text}')
+        print('-' * 80)
+
+if __name__ == "__main__":
+    show_consolidated_history(sys.argv[1:] or ['.'])
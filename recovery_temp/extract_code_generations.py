@@ -1,6 +1,8 @@
 import json
 import re
 
+from write_behind import WriteBehindWriter
+
 def extract_code_generations():
     # Cargar generaciones
     with open('aiService_generations_recovery.json', 'r', encoding='utf-8') as f:
@@ -28,30 +30,32 @@ def extract_code_generations():
     print(f'\n🤖 ÚLTIMAS {min(10, len(recent_code_gens))} GENERACIONES CON CÓDIGO:')
     print('=' * 80)
     
-    for i, (gen_idx, gen) in enumerate(recent_code_gens[-10:]):
-        content = gen.get('content', gen.get('text', ''))
-        desc = gen.get('textDescription', f'Generación {gen_idx}')
-        
-        print(f'\n=== GENERACIÓN {gen_idx} ===')
-        print(f'Descripción: {desc[:100]}...' if len(desc) > 100 else f'Descripción: {desc}')
-        
-        # Guardar contenido completo en archivo
-        filename = f'generation_{gen_idx}_code.txt'
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f'GENERACIÓN {gen_idx}\n')
-            f.write('=' * 50 + '\n')
-            f.write(f'Descripción: {desc}\n')
-            f.write('=' * 50 + '\n\n')
-            f.write(content)
-        
-        # Mostrar preview
-        if len(content) > 1000:
-            print(f'Vista previa (primeros 500 chars): {content[:500]}...')
-            print(f'💾 Contenido completo guardado en: {filename}')
-        else:
-            print(f'Contenido completo: {content}')
-        
-        print('-' * 80)
+    # Las escrituras van a un pool de hilos; el bucle sigue mientras se guardan
+    with WriteBehindWriter() as writer:
+        for i, (gen_idx, gen) in enumerate(recent_code_gens[-10:]):
+            content = gen.get('content', gen.get('text', ''))
+            desc = gen.get('textDescription', f'Generación {gen_idx}')
+            
+            print(f'\n=== GENERACIÓN {gen_idx} ===')
+            print(f'Descripción: {desc[:100]}...' if len(desc) > 100 else f'Descripción: {desc}')
+            
+            # Guardar contenido completo en archivo
+            filename = f'generation_{gen_idx}_code.txt'
+            writer.submit(filename,
+                          f'GENERACIÓN {gen_idx}\n',
+                          '=' * 50 + '\n',
+                          f'Descripción: {desc}\n',
+                          '=' * 50 + '\n\n',
+                          content)
+            
+            # Mostrar preview
+            if len(content) > 1000:
+                print(f'Vista previa (primeros 500 chars): {content[:500]}...')
+                print(f'💾 Contenido completo guardado en: {filename}')
+            else:
+                print(f'Contenido completo: {content}')
+            
+            print('-' * 80)
 
 def extract_composer_data():
     print('\n\n📝 ANALIZANDO DATOS DEL COMPOSITOR...')
@@ -69,36 +73,37 @@ def extract_composer_data():
         else:
             print(f'  - {key}: {type(value).__name__}')
     
-    # Si hay datos de compositores, extraerlos
-    if 'allComposers' in composer_data:
-        composers = composer_data['allComposers']
-        print(f'\nCompositores encontrados: {list(composers.keys()) if composers else "ninguno"}')
+    # Si hay datos de compositores, extraerlos (escrituras en segundo plano)
+    with WriteBehindWriter() as writer:
+        if 'allComposers' in composer_data:
+            composers = composer_data['allComposers']
+            print(f'\nCompositores encontrados: {list(composers.keys()) if composers else "ninguno"}')
         
-        for composer_id, composer_info in composers.items():
-            if isinstance(composer_info, dict) and 'tabs' in composer_info:
-                tabs = composer_info['tabs']
-                print(f'\nCompositor {composer_id}: {len(tabs)} tabs')
+            for composer_id, composer_info in composers.items():
+                if isinstance(composer_info, dict) and 'tabs' in composer_info:
+                    tabs = composer_info['tabs']
+                    print(f'\nCompositor {composer_id}: {len(tabs)} tabs')
                 
-                for tab_id, tab_info in tabs.items():
-                    if 'diffs' in tab_info:
-                        diffs = tab_info['diffs']
-                        print(f'  Tab {tab_id}: {len(diffs)} diffs')
+                    for tab_id, tab_info in tabs.items():
+                        if 'diffs' in tab_info:
+                            diffs = tab_info['diffs']
+                            print(f'  Tab {tab_id}: {len(diffs)} diffs')
                         
-                        # Guardar diffs importantes
-                        for diff_idx, diff in enumerate(diffs):
-                            if isinstance(diff, dict) and 'diff' in diff:
-                                diff_content = diff['diff']
-                                if len(diff_content) > 100:  # Solo diffs significativos
-                                    filename = f'composer_diff_{composer_id}_{tab_id}_{diff_idx}.txt'
-                                    with open(filename, 'w', encoding='utf-8') as f:
-                                        f.write(f'DIFF DEL COMPOSITOR\n')
-                                        f.write('=' * 50 + '\n')
-                                        f.write(f'Compositor: {composer_id}\n')
-                                        f.write(f'Tab: {tab_id}\n')
-                                        f.write(f'Diff índice: {diff_idx}\n')
-                                        f.write('=' * 50 + '\n\n')
-                                        f.write(str(diff_content))
-                                    print(f'    💾 Diff guardado en: {filename}')
+                            # Guardar diffs importantes
+                            for diff_idx, diff in enumerate(diffs):
+                                if isinstance(diff, dict) and 'diff' in diff:
+                                    diff_content = diff['diff']
+                                    if len(diff_content) > 100:  # Solo diffs significativos
+                                        filename = f'composer_diff_{composer_id}_{tab_id}_{diff_idx}.txt'
+                                        writer.submit(filename,
+                                                      f'DIFF DEL COMPOSITOR\n',
+                                                      '=' * 50 + '\n',
+                                                      f'Compositor: {composer_id}\n',
+                                                      f'Tab: {tab_id}\n',
+                                                      f'Diff índice: {diff_idx}\n',
+                                                      '=' * 50 + '\n\n',
+                                                      str(diff_content))
+                                        print(f'    💾 Diff guardado en: {filename}')
 
 if __name__ == "__main__":
     extract_code_generations()
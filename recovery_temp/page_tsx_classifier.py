@@ -0,0 +1,82 @@
+# Indicadores que puntúan (mismo orden y peso 1 que el is_likely_page_tsx original)
+PAGE_TSX_INDICATORS = [
+    'export default function',
+    'export default',
+    'import React',
+    'import {',
+    'from \'react\'',
+    'from "react"',
+    'return (',
+    'return(',
+    '<div',
+    'className=',
+    'useState',
+    'useEffect'
+]
+
+# Etiquetas que indican JSX (no puntúan, pero cuentan para la estructura)
+JSX_TAGS = ['<div', '<span', '<p', '<h1', '<h2', '<section', '<main']
+
+# Literales usados para detectar estructura de función
+STRUCTURE_LITERALS = ['function', 'return', '{']
+
+FEATURE_NAMES = list(dict.fromkeys(PAGE_TSX_INDICATORS + JSX_TAGS + STRUCTURE_LITERALS))
+
+DEFAULT_WEIGHTS = {name: 1 for name in PAGE_TSX_INDICATORS}
+DEFAULT_THRESHOLD = 3
+
+def extract_features(content):
+    """Vector 0/1 (en el orden de FEATURE_NAMES) de los literales presentes en el texto"""
+    # Cada `in` es una búsqueda en C; cada literal se comprueba una sola vez
+    # aunque aparezca en varias listas
+    return [1 if name in content else 0 for name in FEATURE_NAMES]
+
+def _has(content, found, literal):
+    # Busca `literal` en `content` solo la primera vez que se pregunta por él
+    if literal not in found:
+        found[literal] = literal in content
+    return found[literal]
+
+def score_page_tsx_batch(contents, weights=None, threshold=DEFAULT_THRESHOLD, min_length=100,
+                         with_features=True):
+    """Clasifica todo un corpus de contenidos de una vez.
+
+    Devuelve una lista (en el mismo orden que `contents`) de diccionarios con
+    'score', 'features' (vector de FEATURE_NAMES) e 'is_page_tsx'. `weights`
+    asigna un peso a cada literal; por defecto cada indicador de
+    PAGE_TSX_INDICATORS vale 1, como en el clasificador original.
+
+    Con `with_features=False` no se calcula el vector ('features' es None) y
+    solo se buscan los literales necesarios para la puntuación y el veredicto,
+    cortando en cuanto se sabe la respuesta como hacía el original.
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    weight_items = list(weights.items())
+
+    results = []
+    for content in contents:
+        content = content or ''
+        found = {}
+        features = None
+        if with_features:
+            features = extract_features(content)
+            found = dict(zip(FEATURE_NAMES, map(bool, features)))
+
+        score = sum(weight for literal, weight in weight_items if _has(content, found, literal))
+
+        # También verificar que no sea solo texto o documentación
+        has_jsx_like = any(_has(content, found, tag) for tag in JSX_TAGS)
+        has_function_structure = _has(content, found, 'function') and \
+            (_has(content, found, 'return') or _has(content, found, '{'))
+
+        results.append({
+            'score': score,
+            'features': features,
+            'is_page_tsx': score >= threshold and (has_jsx_like or has_function_structure) and len(content) > min_length
+        })
+    return results
+
+def is_likely_page_tsx(content):
+    """Determina si el contenido es probablemente código de page.tsx"""
+    return score_page_tsx_batch([content], with_features=False)[0]['is_page_tsx']
@@ -2,6 +2,8 @@ import json
 import re
 from datetime import datetime
 
+from write_behind import WriteBehindWriter
+
 def recover_page_tsx():
     print('🔍 BUSCANDO VERSIONES DE page.tsx ANTES DE LAS 15:00 DEL 28/07/2025')
     print('=' * 80)
@@ -87,40 +89,42 @@ def recover_page_tsx():
     print(f'\n🎯 ENCONTRADAS {len(page_tsx_versions)} VERSIONES DE page.tsx')
     print('=' * 80)
     
-    # Mostrar las 5 versiones con más código
-    for i, version in enumerate(page_tsx_versions[:5]):
-        print(f'\n=== VERSIÓN {i+1} (más código) ===')
-        print(f'Fuente: {version["source"]}')
-        print(f'Tamaño: {version["code_length"]} caracteres')
+    # Las versiones se guardan en segundo plano mientras se muestran
+    with WriteBehindWriter() as writer:
+        # Mostrar las 5 versiones con más código
+        for i, version in enumerate(page_tsx_versions[:5]):
+            print(f'\n=== VERSIÓN {i+1} (más código) ===')
+            print(f'Fuente: {version["source"]}')
+            print(f'Tamaño: {version["code_length"]} caracteres')
         
-        if version['timestamp']:
-            readable_time = datetime.fromtimestamp(version['timestamp'] / 1000)
-            print(f'Timestamp: {readable_time}')
+            if version['timestamp']:
+                readable_time = datetime.fromtimestamp(version['timestamp'] / 1000)
+                print(f'Timestamp: {readable_time}')
         
-        if version['source'] == 'generation':
-            print(f'Generación: {version["index"]}')
-            print(f'Descripción: {version["description"][:100]}...')
-        else:
-            print(f'Compositor: {version["composer_id"]}')
-            print(f'Tab: {version["tab_id"]}')
+            if version['source'] == 'generation':
+                print(f'Generación: {version["index"]}')
+                print(f'Descripción: {version["description"][:100]}...')
+            else:
+                print(f'Compositor: {version["composer_id"]}')
+                print(f'Tab: {version["tab_id"]}')
         
-        # Guardar la versión completa
-        filename = f'page_tsx_version_{i+1}_{version["source"]}.tsx'
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(version['code'])
+            # Guardar la versión completa
+            filename = f'page_tsx_version_{i+1}_{version["source"]}.tsx'
+            writer.submit(filename, version['code'])
         
-        print(f'💾 Guardado en: {filename}')
+            print(f'💾 Guardado en: {filename}')
         
-        # Mostrar preview
-        preview = version['code'][:500]
-        print(f'Vista previa:\n{preview}...')
-        print('-' * 80)
+            # Mostrar preview
+            preview = version['code'][:500]
+            print(f'Vista previa:\n{preview}...')
+            print('-' * 80)
+    
+        # Guardar la versión con más código como la "recuperada"
+        if page_tsx_versions:
+            writer.submit('page_tsx_RECOVERED.tsx', page_tsx_versions[0]['code'])
     
-    # Guardar la versión con más código como la "recuperada"
     if page_tsx_versions:
         best_version = page_tsx_versions[0]
-        with open('page_tsx_RECOVERED.tsx', 'w', encoding='utf-8') as f:
-            f.write(best_version['code'])
         
         print(f'\n🎉 ¡VERSIÓN CON MÁS CÓDIGO RECUPERADA!')
         print(f'💾 Guardada como: page_tsx_RECOVERED.tsx')
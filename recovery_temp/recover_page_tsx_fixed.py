@@ -2,6 +2,10 @@ import json
 import re
 from datetime import datetime
 
+from composer_sessions import join_generations_to_composers, generations_for_session
+from page_tsx_classifier import is_likely_page_tsx, score_page_tsx_batch
+from write_behind import WriteBehindWriter
+
 def recover_page_tsx():
     print('🔍 BUSCANDO VERSIONES DE page.tsx ANTES DE LAS 15:00 DEL 28/07/2025')
     print('=' * 80)
@@ -18,6 +22,14 @@ def recover_page_tsx():
     
     page_tsx_versions = []
     
+    # Clasificar de una vez solo las generaciones anteriores al timestamp objetivo
+    candidate_indices = [i for i, gen in enumerate(generations) if gen.get('unixMs', 0) <= target_timestamp]
+    candidate_scores = score_page_tsx_batch(
+        (generations[i].get('content', generations[i].get('text', '')) for i in candidate_indices),
+        with_features=False
+    )
+    gen_scores = dict(zip(candidate_indices, candidate_scores))
+    
     # 1. Buscar en generaciones
     print('\n📋 ANALIZANDO GENERACIONES...')
     for i, gen in enumerate(generations):
@@ -35,13 +47,14 @@ def recover_page_tsx():
             ('import' in content and 'return (' in content and 'tsx' in content.lower())):
             
             # Extraer código de page.tsx si está presente
-            page_tsx_code = extract_page_tsx_code(content)
+            page_tsx_code = extract_page_tsx_code(content, gen_scores[i]['is_page_tsx'])
             if page_tsx_code and len(page_tsx_code) > 100:  # Solo código significativo
                 page_tsx_versions.append({
                     'source': 'generation',
                     'index': i,
                     'timestamp': timestamp,
                     'description': desc,
+                    'score': gen_scores[i]['score'],
                     'code': page_tsx_code,
                     'code_length': len(page_tsx_code)
                 })
@@ -54,6 +67,9 @@ def recover_page_tsx():
         composers_list = composer_data['allComposers']
         print(f'  Encontrados {len(composers_list)} compositores')
         
+        # Relacionar generaciones con compositores por ventana de tiempo
+        sessions_index = join_generations_to_composers(composers_list, generations)
+        
         for composer in composers_list:
             if isinstance(composer, dict):
                 composer_id = composer.get('composerId', 'unknown')
@@ -68,8 +84,10 @@ def recover_page_tsx():
                 readable_time = datetime.fromtimestamp(last_updated / 1000) if last_updated else "Sin fecha"
                 print(f'      Última actualización: {readable_time}')
                 
-                # Buscar tabs en el compositor - necesitamos cargar desde otra fuente
-                # Los datos de tabs pueden estar en una estructura diferente
+                # Generaciones producidas durante la sesión [createdAt, lastUpdatedAt]
+                session_gens = generations_for_session(sessions_index, composer_id)
+                if session_gens:
+                    print(f'      Generaciones en la sesión: {[i for i, _ in session_gens]}')
     
     # 3. Buscar en todas las generaciones patrones de código TSX extenso
     print('\n🔍 BUSCANDO CÓDIGO TSX EXTENSO EN TODAS LAS GENERACIONES...')
@@ -82,60 +100,66 @@ def recover_page_tsx():
         desc = gen.get('textDescription', '')
         
         # Buscar código extenso que parezca ser componente React
-        if len(content) > 500 and is_likely_page_tsx(content):
+        if len(content) > 500 and gen_scores[i]['is_page_tsx']:
             page_tsx_versions.append({
                 'source': 'generation_tsx',
                 'index': i,
                 'timestamp': timestamp,
                 'description': desc,
+                'score': gen_scores[i]['score'],
                 'code': content,
                 'code_length': len(content)
             })
             readable_time = datetime.fromtimestamp(timestamp / 1000) if timestamp else "Sin timestamp"
             print(f'  ✅ Código TSX extenso {i}: {len(content)} chars - {readable_time}')
     
-    # 4. Ordenar por cantidad de código (descendente)
-    page_tsx_versions.sort(key=lambda x: x['code_length'], reverse=True)
+    # 4. Ordenar por cantidad de código (descendente), desempate por puntuación
+    page_tsx_versions.sort(key=lambda x: (x['code_length'], x.get('score', 0)), reverse=True)
     
     print(f'\n🎯 ENCONTRADAS {len(page_tsx_versions)} VERSIONES CON CÓDIGO')
     print('=' * 80)
     
-    # Mostrar las 5 versiones con más código
-    for i, version in enumerate(page_tsx_versions[:5]):
-        print(f'\n=== VERSIÓN {i+1} (más código) ===')
-        print(f'Fuente: {version["source"]}')
-        print(f'Tamaño: {version["code_length"]} caracteres')
+    # Las versiones se guardan en segundo plano mientras se muestran
+    with WriteBehindWriter() as writer:
+        # Mostrar las 5 versiones con más código
+        for i, version in enumerate(page_tsx_versions[:5]):
+            print(f'\n=== VERSIÓN {i+1} (más código) ===')
+            print(f'Fuente: {version["source"]}')
+            print(f'Tamaño: {version["code_length"]} caracteres')
         
-        if version['timestamp']:
-            readable_time = datetime.fromtimestamp(version['timestamp'] / 1000)
-            print(f'Timestamp: {readable_time}')
+            if 'score' in version:
+                print(f'Puntuación: {version["score"]}')
         
-        if 'index' in version:
-            print(f'Generación: {version["index"]}')
+            if version['timestamp']:
+                readable_time = datetime.fromtimestamp(version['timestamp'] / 1000)
+                print(f'Timestamp: {readable_time}')
         
-        if 'description' in version:
-            desc = version['description']
-            print(f'Descripción: {desc[:100]}{"..." if len(desc) > 100 else ""}')
+            if 'index' in version:
+                print(f'Generación: {version["index"]}')
         
-        # Guardar la versión completa
-        filename = f'page_tsx_version_{i+1}_{version["source"]}.tsx'
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(version['code'])
+            if 'description' in version:
+                desc = version['description']
+                print(f'Descripción: {desc[:100]}{"..." if len(desc) > 100 else ""}')
         
-        print(f'💾 Guardado en: {filename}')
+            # Guardar la versión completa
+            filename = f'page_tsx_version_{i+1}_{version["source"]}.tsx'
+            writer.submit(filename, version['code'])
         
-        # Mostrar preview de las primeras líneas significativas
-        lines = version['code'].split('\n')
-        significant_lines = [line for line in lines[:20] if line.strip() and not line.strip().startswith('//')]
-        preview = '\n'.join(significant_lines[:10])
-        print(f'Vista previa:\n{preview}')
-        print('-' * 80)
-    
-    # Guardar la versión con más código como la "recuperada"
+            print(f'💾 Guardado en: {filename}')
+        
+            # Mostrar preview de las primeras líneas significativas
+            lines = version['code'].split('\n')
+            significant_lines = [line for line in lines[:20] if line.strip() and not line.strip().startswith('//')]
+            preview = '\n'.join(significant_lines[:10])
+            print(f'Vista previa:\n{preview}')
+            print('-' * 80)
+    
+        # Guardar la versión con más código como la "recuperada"
+        if page_tsx_versions:
+            writer.submit('page_tsx_RECOVERED.tsx', page_tsx_versions[0]['code'])
+    
     if page_tsx_versions:
         best_version = page_tsx_versions[0]
-        with open('page_tsx_RECOVERED.tsx', 'w', encoding='utf-8') as f:
-            f.write(best_version['code'])
         
         print(f'\n🎉 ¡VERSIÓN CON MÁS CÓDIGO RECUPERADA!')
         print(f'💾 Guardada como: page_tsx_RECOVERED.tsx')
@@ -150,7 +174,7 @@ def recover_page_tsx():
         print('❌ No se encontraron versiones de código antes del timestamp especificado')
         return None
 
-def extract_page_tsx_code(content):
+def extract_page_tsx_code(content, likely_page_tsx=None):
     """Extrae código de page.tsx del contenido"""
     # Patrón 1: Bloques de código TypeScript/React en markdown
     tsx_patterns = [
@@ -168,35 +192,12 @@ def extract_page_tsx_code(content):
                 return match.strip()
     
     # Patrón 2: Si el contenido completo parece ser código TSX
-    if is_likely_page_tsx(content):
+    if likely_page_tsx is None:
+        likely_page_tsx = is_likely_page_tsx(content)
+    if likely_page_tsx:
         return content.strip()
     
     return None
 
-def is_likely_page_tsx(content):
-    """Determina si el contenido es probablemente código de page.tsx"""
-    indicators = [
-        'export default function',
-        'export default',
-        'import React',
-        'import {',
-        'from \'react\'',
-        'from "react"',
-        'return (',
-        'return(',
-        '<div',
-        'className=',
-        'useState',
-        'useEffect'
-    ]
-    
-    score = sum(1 for indicator in indicators if indicator in content)
-    
-    # También verificar que no sea solo texto o documentación
-    has_jsx_like = any(tag in content for tag in ['<div', '<span', '<p', '<h1', '<h2', '<section', '<main'])
-    has_function_structure = 'function' in content and ('return' in content or '{' in content)
-    
-    return score >= 3 and (has_jsx_like or has_function_structure) and len(content) > 100
-
 if __name__ == "__main__":
     recover_page_tsx() 
\ No newline at end of file
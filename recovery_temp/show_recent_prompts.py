@@ -1,9 +1,16 @@
 import json
+import sys
+
+from consolidate_history import merged_history
+
+def show_recent_prompts(snapshots=None):
+    if snapshots:
+        # Prompts de varios workspaces, mezclados por tiempo y sin duplicados
+        prompts = [entry['record'] for entry in merged_history(snapshots, kinds=('prompt',))]
+    else:
+        with open('aiService_prompts_recovery.json', 'r', encoding='utf-8') as f:
+            prompts = json.load(f)
 
-def show_recent_prompts():
-    with open('aiService_prompts_recovery.json', 'r', encoding='utf-8') as f:
-        prompts = json.load(f)
-    
     print('🔍 ÚLTIMOS 15 PROMPTS (antes del restore checkpoint):')
     print('=' * 80)
     
@@ -16,4 +23,4 @@ def show_recent_prompts():
         print('-' * 80)
 
 if __name__ == "__main__":
-    show_recent_prompts() 
\ No newline at end of file
+    show_recent_prompts(sys.argv[1:])
\ No newline at end of file
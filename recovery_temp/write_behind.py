@@ -0,0 +1,53 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class WriteBehindWriter:
+    """Escribe archivos en segundo plano con un pool de hilos.
+
+    El bucle principal sigue clasificando mientras los hilos codifican y
+    escriben en disco. Como mucho hay `max_pending` escrituras en vuelo:
+    si el disco va lento, `submit` se bloquea hasta que quede hueco, así
+    la memoria no crece con el número de archivos.
+    """
+
+    def __init__(self, max_workers=4, max_pending=16):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._errors = []
+
+    def submit(self, filename, *parts):
+        """Encola la escritura de `parts` (textos) en `filename`"""
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(self._write, filename, parts)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._done)
+
+    def _write(self, filename, parts):
+        with open(filename, 'w', encoding='utf-8') as f:
+            for part in parts:
+                f.write(part)
+
+    def _done(self, future):
+        self._slots.release()
+        error = future.exception()
+        if error is not None:
+            self._errors.append(error)
+
+    def close(self):
+        """Espera a que terminen todas las escrituras y relanza el primer error"""
+        self._pool.shutdown(wait=True)
+        if self._errors:
+            raise self._errors[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._pool.shutdown(wait=True)
+        return False